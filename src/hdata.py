@@ -28,6 +28,7 @@ class BaseSchData():
             raise ValueError("Didn't get type: pcbnew.BOARD")
 
         self._board = baseBoard
+        self._footprintsByPath = None
 
         schematicPath = Path(baseBoard.GetFileName()).with_suffix(".kicad_sch")
 
@@ -60,6 +61,13 @@ class BaseSchData():
     def subBoards(self):
         return self._subBoards
 
+    @property
+    def footprintsByPath(self):
+        # Footprints are only moved while replicating, so one index serves every instance
+        if self._footprintsByPath is None:
+            self._footprintsByPath = footprints_by_path(self._board)
+        return self._footprintsByPath
+
     @property
     def validSubBoards(self):
         return {key:value for key, value in self._subBoards.items() if value.isValid}
@@ -86,7 +94,7 @@ class BaseSchData():
                 if isEnabled == None:
                     logger.warn("isEnabled empty")
                     continue
-                instance._enabled = isEnabled
+                instance.enabled = isEnabled
 
 
     def replicate(self):
@@ -134,6 +142,10 @@ class SubPcb:
 
         self._instances = [ PcbInstance(mainSch, self, instance) for instance in instanceList]
 
+        # Kept up to date by PcbInstance.enabled so the tri-state needs no scan
+        self._instanceCount = len(self._instances)
+        self._checkedCount = 0
+
 
     @property
     def board(self):
@@ -177,19 +189,17 @@ class SubPcb:
         if not self.isValid:
             return 0
         
-        instanceNum  = len(self.instances)
-        enabledNum   = len(self.enabledInstances)
-        
-        if instanceNum == 0:
+        if self._checkedCount == 0:
             return 0 # No instances enabled
-        elif enabledNum == instanceNum:
+        elif self._checkedCount == self._instanceCount:
             return 1 # All instances enabled
         else:
             return -1 # Some Instances enabled
 
     def setInstancesState(self, checked):
         for instance in self._instances:
-            instance.enabled = checked
+            instance._enabled = checked
+        self._checkedCount = self._instanceCount if checked else 0
 
 
     def replicateInstances(self):
@@ -222,12 +232,17 @@ class PcbInstance():
     
     @enabled.setter
     def enabled(self, value):
+        if value == self._enabled:
+            return
         self._enabled = value
+        self._SubPcb._checkedCount += 1 if value else -1
 
     def replicateLayout(self):
         """Enforce the positions of objects in PCB template on PCB mutate."""
 
-        fpTranslator = FootprintTranslator(self._mainSch.board, self._uuidPath)
+        fpTranslator = FootprintTranslator(
+            self._mainSch.board, self._uuidPath, self._mainSch.footprintsByPath
+        )
 
         # Find the anchor footprint on the PCBs:
         subPcbAnchor = self._SubPcb.anchorFootprint
@@ -236,7 +251,9 @@ class PcbInstance():
         if not instanceAnchor:
             return
 
-        replContext: ReplicateContext = ReplicateContext(subPcbAnchor, instanceAnchor, self._uuid)
+        replContext: ReplicateContext = ReplicateContext(
+            subPcbAnchor, instanceAnchor, self._uuid, self._mainSch.board
+        )
 
         # Clear Volatile items first
         clear_volatile_items(replContext.group)
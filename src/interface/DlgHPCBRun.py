@@ -9,14 +9,14 @@ from .DlgHPCBRun_Base import DlgHPCBRun_Base
 
 logger = logging.getLogger("hierpcb")
 
-def wxStateFromTri(int):
-    match int:
-        case -1:
-            return wx.CHK_UNDETERMINED
-        case 0:
-            return wx.CHK_UNCHECKED
-        case 1:
-            return wx.CHK_CHECKED
+_TRI_STATE = {
+    -1: wx.CHK_UNDETERMINED,
+    0: wx.CHK_UNCHECKED,
+    1: wx.CHK_CHECKED,
+}
+
+def wxStateFromTri(triState):
+    return _TRI_STATE[triState]
 
 class DlgHPCBRun(DlgHPCBRun_Base):
     def __init__(self, parent: wx.Window, schData: BaseSchData):
@@ -27,33 +27,66 @@ class DlgHPCBRun(DlgHPCBRun_Base):
         self.schData = schData
 
         rootItem = self.treeApplyTo.GetRootItem()
-        
-        for subPcb in schData.subBoards.values():
-            #Show invalid pcbs
-            if not subPcb.isValid:
-                invalidText = f"{subPcb._name} INVALID!"
+
+        # Instance items are only created once their SubPcb is first expanded
+        self._populatedSubPcbs = set()
+        # Tree item of each SubPcb, instances reach their SubPcb through PcbInstance._SubPcb
+        self._subPcbItems: Dict[SubPcb, wx.TreeListItem] = {}
+
+        # Check states are applied once the tree is built
+        itemStates = []
+
+        # Suppress redraws while populating the tree
+        self.treeApplyTo.Freeze()
+        try:
+            # Valid PCBs first, then invalid ones, each sorted by name
+            orderedSubPcbs = sorted(
+                schData.subBoards.values(), key=lambda subPcb: (not subPcb.isValid, subPcb._name)
+            )
+
+            for subPcb in orderedSubPcbs:
+                #Show invalid pcbs
+                if not subPcb.isValid:
+                    invalidText = f"{subPcb._name} INVALID!"
+                    subPcbItem: wx.TreeListItem = self.treeApplyTo.AppendItem(
+                        parent=rootItem, text=invalidText, data=subPcb
+                    )
+                    continue
+                
+                #Add valid PCBs 
                 subPcbItem: wx.TreeListItem = self.treeApplyTo.AppendItem(
-                    parent=rootItem, text=invalidText, data=subPcb
+                    parent=rootItem, text=str(subPcb._name), data=subPcb
                 )
-                continue
-            
-            #Add valid PCBs 
-            subPcbItem: wx.TreeListItem = self.treeApplyTo.PrependItem(
-                parent=rootItem, text=str(subPcb._name), data=subPcb
-            )
-            checkState = wxStateFromTri(subPcb.getStateFromInstances())
-            self.treeApplyTo.CheckItem(subPcbItem, checkState)
+                self._subPcbItems[subPcb] = subPcbItem
+                itemStates.append((subPcbItem, wxStateFromTri(subPcb.getStateFromInstances())))
+
+                # Placeholder so the item can be expanded
+                if subPcb._instances:
+                    self.treeApplyTo.AppendItem(parent=subPcbItem, text="Loading...")
+
+            for item, checkState in itemStates:
+                self.treeApplyTo.CheckItem(item, checkState)
+        finally:
+            self.treeApplyTo.Thaw()
+
+    def populateInstances(self, subPcbItem: wx.TreeListItem, subPcb: SubPcb):
+        """Replace the placeholder under a SubPcb item with its instances."""
+        self._populatedSubPcbs.add(subPcb)
+
+        self.treeApplyTo.Freeze()
+        try:
+            placeholder = self.treeApplyTo.GetFirstChild(subPcbItem)
+            if placeholder.IsOk():
+                self.treeApplyTo.DeleteItem(placeholder)
 
-            # Populate subpcb instances
             for instance in subPcb._instances:
                 instanceItem: wx.TreeListItem = self.treeApplyTo.AppendItem(
                     parent=subPcbItem, text=instance._name, data=instance
                 )
                 if instance.enabled:
                     self.treeApplyTo.CheckItem(instanceItem)
-            
-            self.treeApplyTo.Expand(subPcbItem)
-
+        finally:
+            self.treeApplyTo.Thaw()
 
     def getSelectedSubPCB(self) -> Optional[SubPcb]:
         selItem = self.treeApplyTo.GetSelection()
@@ -68,6 +101,13 @@ class DlgHPCBRun(DlgHPCBRun_Base):
 
         return subPcb
 
+    def handleTreeExpanding( self, event ):
+        eventItem = event.GetItem()
+        objData = self.treeApplyTo.GetItemData(eventItem)
+
+        if isinstance(objData, SubPcb) and objData not in self._populatedSubPcbs:
+            self.populateInstances(eventItem, objData)
+
     def handleTreeCheck( self, event ):
         eventItem = event.GetItem()
         objData = self.treeApplyTo.GetItemData(eventItem)
@@ -86,9 +126,9 @@ class DlgHPCBRun(DlgHPCBRun_Base):
             objData.enabled = (state == wx.CHK_CHECKED)
 
             #Update parent tri state
-            parent = self.treeApplyTo.GetItemParent(eventItem)
+            parentSubpcb = objData._SubPcb
+            parent = self._subPcbItems[parentSubpcb]
 
-            parentSubpcb = self.treeApplyTo.GetItemData(parent)
             checkState = wxStateFromTri(parentSubpcb.getStateFromInstances())
             self.treeApplyTo.CheckItem(parent, checkState)
 
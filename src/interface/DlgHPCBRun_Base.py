@@ -67,6 +67,7 @@ class DlgHPCBRun_Base ( wx.Dialog ):
 		self.Centre( wx.BOTH )
 
 		# Connect Events
+		self.treeApplyTo.Bind( wx.dataview.EVT_TREELIST_ITEM_EXPANDING, self.handleTreeExpanding )
 		self.treeApplyTo.Bind( wx.dataview.EVT_TREELIST_ITEM_CHECKED, self.handleTreeCheck )
 		self.treeApplyTo.Bind( wx.dataview.EVT_TREELIST_SELECTION_CHANGED, self.handleSelectionChange )
 		self.anchorChoice.Bind( wx.EVT_CHOICE, self.handleAnchorChange )
@@ -77,6 +78,9 @@ class DlgHPCBRun_Base ( wx.Dialog ):
 
 
 	# Virtual event handlers, override them in your derived class
+	def handleTreeExpanding( self, event ):
+		event.Skip()
+
 	def handleTreeCheck( self, event ):
 		event.Skip()
 
@@ -26,8 +26,11 @@ class ReportedError:
         self.message = message
         self.level = level
         self.footprint = footprint
+        self.sheet = None
+        self.pcb = None
 
-        logger.debug(str(self))
+        # Only the summary is logged, the full message is built by __str__ on demand
+        logger.debug("ERR.%s\t%s", self.level, self.title)
 
     def __str__(self):
         msg = [f"ERR.{self.level}\t{self.title}"]
@@ -43,6 +46,24 @@ class ReportedError:
         return "\n".join(msg)
 
 
+def _transform_points(
+    xs: List[int], ys: List[int],
+    ax: int, ay: int, bx: int, by: int,
+    cs: float, sn: float
+) -> Tuple[List[int], List[int]]:
+    """Rotate points about (ax, ay) and move them to (bx, by), in one pass."""
+    new_xs = []
+    new_ys = []
+    append_x = new_xs.append
+    append_y = new_ys.append
+    for x, y in zip(xs, ys):
+        dx = x - ax
+        dy = y - ay
+        append_x(int(dy * sn + dx * cs + bx))
+        append_y(int(dy * cs - dx * sn + by))
+    return new_xs, new_ys
+
+
 class PositionTransform:
     def __init__(self, template: pcbnew.FOOTPRINT, mutate: pcbnew.FOOTPRINT) -> None:
         # These are stored such that adding these to the position and rotation of the `template`
@@ -50,50 +71,77 @@ class PositionTransform:
         self.anchor_template = template
         self.anchor_mutate = mutate
 
+        # The anchors don't change while replicating, so cache their frames once:
+        templatePos = template.GetPosition()
+        mutatePos = mutate.GetPosition()
+        self._ax, self._ay = templatePos.x, templatePos.y
+        self._bx, self._by = mutatePos.x, mutatePos.y
+
+        rotationDegrees = mutate.GetOrientationDegrees() - template.GetOrientationDegrees()
+
+        # Rotations by a multiple of 90 degrees are done exactly, in integers
+        if rotationDegrees % 90 == 0:
+            self._quadrant = int(rotationDegrees // 90) % 4
+            self._cos, self._sin = ((1, 0), (0, 1), (-1, 0), (0, -1))[self._quadrant]
+        else:
+            self._quadrant = None
+            rotation = math.radians(rotationDegrees)
+            self._cos = math.cos(rotation)
+            self._sin = math.sin(rotation)
+        self._orient_delta = mutate.GetOrientation() - template.GetOrientation()
+
+        # Items only need rotating when the anchors aren't aligned
+        self.isRotated = self._quadrant != 0
+
     def translate(self, pos_template: pcbnew.VECTOR2I) -> pcbnew.VECTOR2I:
         # Find the position of fp_template relative to the anchor_template:
-        delta_x: int = pos_template.x - self.anchor_template.GetPosition().x
-        delta_y: int = pos_template.y - self.anchor_template.GetPosition().y
-        rotation = math.radians(
-            self.anchor_mutate.GetOrientationDegrees()
-            - self.anchor_template.GetOrientationDegrees()
-        )
+        delta_x: int = pos_template.x - self._ax
+        delta_y: int = pos_template.y - self._ay
+
+        match self._quadrant:
+            case 0:
+                return pcbnew.VECTOR2I(delta_x + self._bx, delta_y + self._by)
+            case 1:
+                return pcbnew.VECTOR2I(delta_y + self._bx, -delta_x + self._by)
+            case 2:
+                return pcbnew.VECTOR2I(-delta_x + self._bx, -delta_y + self._by)
+            case 3:
+                return pcbnew.VECTOR2I(-delta_y + self._bx, delta_x + self._by)
 
         # With this information, we can compute the net position after any rotation:
-        new_x = (
-            delta_y * math.sin(rotation)
-            + delta_x * math.cos(rotation)
-            + self.anchor_mutate.GetPosition().x
-        )
-        new_y = (
-            delta_y * math.cos(rotation)
-            - delta_x * math.sin(rotation)
-            + self.anchor_mutate.GetPosition().y
-        )
+        new_x = delta_y * self._sin + delta_x * self._cos + self._bx
+        new_y = delta_y * self._cos - delta_x * self._sin + self._by
         return pcbnew.VECTOR2I(int(new_x), int(new_y))
 
-    def orient(self, rot_template: float):
-        return (
-            rot_template
-            - self.anchor_template.GetOrientation()
-            + self.anchor_mutate.GetOrientation()
+    def translate_batch(self, xs: List[int], ys: List[int]) -> Tuple[List[int], List[int]]:
+        """Translate many points at once, returning the new x and y coordinates."""
+        return _transform_points(
+            xs, ys, self._ax, self._ay, self._bx, self._by, self._cos, self._sin
         )
 
+    def orient(self, rot_template: float):
+        return rot_template + self._orient_delta
+
 class GroupManager:
     def __init__(self, board: pcbnew.BOARD, groupName: str) -> None:
         self.board: pcbnew.BOARD = board
+        self.groupName = groupName
         self.group = self._create_or_get(groupName)
 
     def _create_or_get(self, group_name: str) -> pcbnew.PCB_GROUP:
         """Get a group by name, creating it if it doesn't exist."""
-        retGroup = None
-        for group in self.board.Groups():
-            if group.GetName() == group_name:
-                retGroup = group
+        # Index the board's groups once, instead of scanning them for every instance:
+        groupCache = getattr(self.board, "_hpcb_group_cache", None)
+        if groupCache is None:
+            groupCache = {group.GetName(): group for group in self.board.Groups()}
+            self.board._hpcb_group_cache = groupCache
+
+        retGroup = groupCache.get(group_name)
         if retGroup is None:
             retGroup = pcbnew.PCB_GROUP(None)
             retGroup.SetName(group_name)
             self.board.Add(retGroup)
+            groupCache[group_name] = retGroup
         return retGroup
 
     def move(self, item: pcbnew.BOARD_ITEM) -> bool:
@@ -102,7 +150,7 @@ class GroupManager:
         # First, check if the footprint is already in the group:
         parent_group = item.GetParentGroup()
         # If the footprint is not already in the group, remove it from the current group:
-        if parent_group and parent_group.GetName() != self.group.GetName():
+        if parent_group and parent_group.GetName() != self.groupName:
             moved = True
             parent_group.RemoveItem(item)
             parent_group = None
@@ -112,14 +160,26 @@ class GroupManager:
 
         return moved
 
+def footprints_by_path(board: pcbnew.BOARD) -> Dict[str, pcbnew.FOOTPRINT]:
+    """Map every footprint on a board by its path."""
+    return {fp.GetPath().AsString(): fp for fp in board.GetFootprints()}
+
 class FootprintTranslator:
-    def __init__(self, searchBoard, searchPrefix):
+    def __init__(self, searchBoard, searchPrefix, footprintsByPath=None):
         self._searchBoard = searchBoard
         self._searchPrefix = searchPrefix
+        # Pass footprintsByPath to share one index across translators of the same board
+        self._footprintsByPath = footprintsByPath
+
+    def _index(self) -> Dict[str, pcbnew.FOOTPRINT]:
+        """Index of the search board's footprints, built on first use."""
+        if self._footprintsByPath is None:
+            self._footprintsByPath = footprints_by_path(self._searchBoard)
+        return self._footprintsByPath
 
     def getTarget(self, subPcbFootprint: pcbnew.FOOTPRINT):
         newPath = pcbnew.KIID_PATH(self._searchPrefix + subPcbFootprint.GetPath().AsString())
-        mainFootprint = self._searchBoard.FindFootprintByPath(newPath)
+        mainFootprint = self._index().get(newPath.AsString())
         return mainFootprint
 
 class ReplicateContext(PositionTransform, GroupManager):
@@ -127,11 +187,14 @@ class ReplicateContext(PositionTransform, GroupManager):
         self,
         sourceAnchorFootprint: pcbnew.FOOTPRINT, 
         targetAnchorFootprint: pcbnew.FOOTPRINT,
-        groupName
+        groupName,
+        targetBoard: pcbnew.BOARD = None
         ):
 
+        # Pass targetBoard to share its caches across contexts,
+        # GetBoard() returns a new wrapper on every call.
         self._sourceBoard = sourceAnchorFootprint.GetBoard()
-        self._targetBoard = targetAnchorFootprint.GetBoard()
+        self._targetBoard = targetBoard or targetAnchorFootprint.GetBoard()
 
         PositionTransform.__init__(self, sourceAnchorFootprint, targetAnchorFootprint)
 
@@ -153,25 +216,27 @@ def footprintInBounds(footprint: pcbnew.FOOTPRINT):
         return False
     return True
 
+# Item types recreated on every replication
+_VOLATILE_TYPES = (
+    # Traces
+    pcbnew.PCB_TRACK,
+    # Drawings
+    pcbnew.PCB_SHAPE, pcbnew.PCB_TEXT,
+    # Zones
+    pcbnew.ZONE,
+)
+
 def clear_volatile_items(group: pcbnew.PCB_GROUP):
     """Remove all Traces, Drawings, Zones in a group."""
-    board = group.GetBoard()
-
-    itemTypesToRemove = (
-        # Traces
-        pcbnew.PCB_TRACK, pcbnew.ZONE,
-        # Drawings
-        pcbnew.PCB_SHAPE, pcbnew.PCB_TEXT,
-        # Zones
-        pcbnew.ZONE
-    )
+    boardRemove = group.GetBoard().RemoveNative
 
     for item in group.GetItems():
 
         # Gets all drawings in a group
-        if isinstance(item.Cast(), itemTypesToRemove):
+        # Cast() is needed, GetItems() only yields BOARD_ITEM wrappers
+        if isinstance(item.Cast(), _VOLATILE_TYPES):
             # Remove every drawing
-            board.RemoveNative(item)
+            boardRemove(item)
 
 
 def copy_footprint_fields(
@@ -190,13 +255,18 @@ def copy_footprint_fields(
     for existingField in targetFootprint.GetFields():
         targetFootprint.RemoveNative(existingField)
     
+    # Every field is rotated by the same relative angle
+    fieldRotation = transform.orient(pcbnew.ANGLE_0)
+
     # Add all the source fields and move them
     for sourceField in sourceFootprint.GetFields():
         newField = sourceField.CloneField()
         newField.SetParent(targetFootprint)
         
-        newField.SetPosition(transform.translate(sourceField.GetPosition()))
-        newField.Rotate(newField.GetPosition(), transform.orient(pcbnew.ANGLE_0))
+        newPosition = transform.translate(sourceField.GetPosition())
+        newField.SetPosition(newPosition)
+        if transform.isRotated:
+            newField.Rotate(newPosition, fieldRotation)
 
         targetFootprint.AddField(newField)
 
@@ -228,22 +298,45 @@ def copy_footprint_data(
     copy_footprint_fields(sourceFootprint, targetFootprint, transform)
 
 def copy_drawings(context: ReplicateContext):
+    rotation = context.orient(pcbnew.ANGLE_0)
+
     for sourceDrawing in context.sourceBoard.GetDrawings(): 
         
         newDrawing = sourceDrawing.Duplicate()
         context.targetBoard.Add(newDrawing)
 
         # Set New Position
-        newDrawing.SetPosition(context.translate(sourceDrawing.GetPosition()))
+        newPosition = context.translate(sourceDrawing.GetPosition())
+        newDrawing.SetPosition(newPosition)
 
         # Drawings dont have .SetOrientation()
         # instead do a relative rotation
-        newDrawing.Rotate(newDrawing.GetPosition(), context.orient(pcbnew.ANGLE_0))
+        if context.isRotated:
+            newDrawing.Rotate(newPosition, rotation)
 
         context.move(newDrawing)
 
-def copy_traces(context: ReplicateContext, netMapping: dict):
-    for sourceTrack in context.sourceBoard.Tracks():
+def find_target_nets(context: ReplicateContext, netMapping: dict) -> dict:
+    """Look up every mapped net (and the unconnected net 0) on the target board once."""
+    netCodes = set(netMapping.values())
+    netCodes.add(0)
+    return {netCode: context.targetBoard.FindNet(netCode) for netCode in netCodes}
+
+def _copy_tracks(
+    context: ReplicateContext,
+    sourceTracks: List[pcbnew.PCB_TRACK],
+    netMapping: dict,
+    targetNets: dict
+) -> List[pcbnew.PCB_TRACK]:
+    """Copy tracks onto the target board, returning the new tracks."""
+    # Translate every start and end point up front, only building VECTOR2I when setting them
+    starts = [sourceTrack.GetStart() for sourceTrack in sourceTracks]
+    ends   = [sourceTrack.GetEnd()   for sourceTrack in sourceTracks]
+    startXs, startYs = context.translate_batch([p.x for p in starts], [p.y for p in starts])
+    endXs,   endYs   = context.translate_batch([p.x for p in ends],   [p.y for p in ends])
+
+    newTracks = []
+    for i, sourceTrack in enumerate(sourceTracks):
         # Copy track to trk:
         # logger.info(f"{track} {type(track)} {track.GetStart()} -> {track.GetEnd()}")
         
@@ -252,19 +345,35 @@ def copy_traces(context: ReplicateContext, netMapping: dict):
 
         sourceNetCode = sourceTrack.GetNetCode()
         newNetCode = netMapping.get(sourceNetCode, 0)
-        newTrack.SetNet(context.targetBoard.FindNet(newNetCode))
+        newTrack.SetNet(targetNets[newNetCode])
 
         # Sets Track start and end point
         # Via's ignore the end point, just copying anyways
-        newTrack.SetStart(context.translate(sourceTrack.GetStart()))
-        newTrack.SetEnd  (context.translate(sourceTrack.GetEnd()  ))
-
-        if type(newTrack) == pcbnew.PCB_VIA:
-            newTrack.SetIsFree(False)
+        newTrack.SetStart(pcbnew.VECTOR2I(startXs[i], startYs[i]))
+        newTrack.SetEnd  (pcbnew.VECTOR2I(endXs[i],   endYs[i]  ))
 
         context.move(newTrack)
+        newTracks.append(newTrack)
+
+    return newTracks
+
+def copy_traces(context: ReplicateContext, netMapping: dict):
+    # Split vias from the other tracks once, so neither copy loop has to check
+    vias = []
+    tracks = []
+    for sourceTrack in context.sourceBoard.Tracks():
+        (vias if sourceTrack.Type() == pcbnew.PCB_VIA_T else tracks).append(sourceTrack)
+
+    targetNets = find_target_nets(context, netMapping)
+
+    _copy_tracks(context, tracks, netMapping, targetNets)
+
+    for newVia in _copy_tracks(context, vias, netMapping, targetNets):
+        newVia.SetIsFree(False)
 
 def copy_zones(context: ReplicateContext, netMapping: dict):
+    targetNets = find_target_nets(context, netMapping)
+    rotation = context.orient(pcbnew.ANGLE_0)
 
     for sourceZone in context.sourceBoard.Zones():
         
@@ -272,7 +381,7 @@ def copy_zones(context: ReplicateContext, netMapping: dict):
 
         sourceNetCode = sourceZone.GetNetCode()
         newNetCode = netMapping.get(sourceNetCode, 0)
-        newZone.SetNet(context.targetBoard.FindNet(newNetCode))
+        newZone.SetNet(targetNets[newNetCode])
 
         context.targetBoard.Add(newZone)
 
@@ -280,14 +389,15 @@ def copy_zones(context: ReplicateContext, netMapping: dict):
         # newZone.SetPosition(transform.translate(zone.GetPosition()))
 
         # Temporary Workaround:
-        # Move zone to 0,0 by moving relative
-        newZone.Move(-newZone.GetPosition())
-        # Move zone to correct location
-        newZone.Move(context.translate(sourceZone.GetPosition()))
+        # Zones can only be moved relatively, so move by the offset to the new location
+        targetPos = context.translate(sourceZone.GetPosition())
+        currentPos = newZone.GetPosition()
+        newZone.Move(pcbnew.VECTOR2I(targetPos.x - currentPos.x, targetPos.y - currentPos.y))
 
         # Drawings dont have .SetOrientation()
         # instead do a relative rotation
-        newZone.Rotate(newZone.GetPosition(), context.orient(pcbnew.ANGLE_0))
+        if context.isRotated:
+            newZone.Rotate(targetPos, rotation)
 
         context.move(newZone)
 
@@ -315,12 +425,15 @@ def enforce_position_footprints(
         copy_footprint_data(sourceFootprint, targetFootprint, context)
 
         # Assumes pads are ordered by the pad number
-        for sourcePadNum, sourcePad in enumerate(sourceFootprint.Pads()):
-            targetPad = targetFootprint.Pads()[sourcePadNum]
-
+        targetPads = list(targetFootprint.Pads())
+        for sourcePadNum, sourcePad in enumerate(list(sourceFootprint.Pads())):
             sourceCode = sourcePad.GetNetCode()
-            targetCode = targetPad.GetNetCode()
-            footprintNetMapping[sourceCode] = targetCode
+            # Keep the first mapping found for each net
+            if sourceCode in footprintNetMapping:
+                continue
+
+            targetPad = targetPads[sourcePadNum]
+            footprintNetMapping[sourceCode] = targetPad.GetNetCode()
 
         # Move the footprint into the group if one is provided:
         context.move(targetFootprint)